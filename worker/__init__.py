@@ -4,7 +4,20 @@ Web Scraper Worker Package
 Provides scalable web scraping functionality using Playwright.
 """
 
-from .scraper import scrape_url, scrape_url_sync, scrape_urls_batch, WebScraper
+import asyncio
+
+# Use uvloop's faster event loop for all scraper coroutines when available
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+from .scraper import (
+    scrape_url, scrape_url_sync, scrape_urls_batch, WebScraper, shutdown_shared_browser,
+    shared_browser, ScrapeResult, format_timestamp, stats,
+)
+from .pool import BrowserPool
 from .config import settings
 
 __all__ = [
@@ -12,6 +25,12 @@ __all__ = [
     'scrape_url_sync', 
     'scrape_urls_batch',
     'WebScraper',
+    'ScrapeResult',
+    'BrowserPool',
+    'shutdown_shared_browser',
+    'shared_browser',
+    'format_timestamp',
+    'stats',
     'settings'
 ]
 
@@ -0,0 +1,39 @@
+"""
+Background Event Loop Module
+
+A single event loop running on a daemon thread for the lifetime of the
+process. Synchronous callers submit coroutines to it, so browsers in its
+pool stay warm between calls.
+"""
+
+from typing import Optional
+import asyncio
+import threading
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop, starting its thread on first use.
+    
+    Returns:
+        The running background event loop
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name='scraper-event-loop', daemon=True
+            )
+            thread.start()
+            _loop = loop
+    return _loop
@@ -0,0 +1,224 @@
+"""
+Scrape Cache Module
+
+Caches of scrape results with a per-entry TTL, so repeated scrapes of the
+same URL return instantly instead of hitting the network. Results are kept
+either in process memory or on disk, where they survive restarts and are
+shared between worker processes.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Any, Hashable, Tuple
+from urllib.parse import urlparse, urlunparse
+import threading
+import time
+
+import diskcache
+import zstandard
+
+if __package__:
+    from .config import settings
+else:
+    from config import settings
+
+
+@lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key.
+
+    Lowercases the scheme and host and strips a trailing slash from the
+    path. The fragment is kept: the page is rendered, so on hash-routed
+    sites different fragments are different pages. Memoized, since the same
+    URLs are normalized over and over across scrapes.
+
+    Args:
+        url: The URL to normalize
+
+    Returns:
+        The normalized URL
+    """
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/')
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path,
+                       parsed.params, parsed.query, parsed.fragment))
+
+
+def copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a result dict, including its nested dicts (meta, timings).
+
+    Args:
+        result: Scrape result dictionary
+
+    Returns:
+        A copy that shares no mutable state with the original
+    """
+    return {key: dict(value) if isinstance(value, dict) else value
+            for key, value in result.items()}
+
+
+def _compress(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a result with its HTML zstd-compressed for storage."""
+    entry = copy_result(result)
+    if isinstance(entry.get('html'), str):
+        entry['html'] = zstandard.ZstdCompressor(level=3).compress(entry['html'].encode('utf-8'))
+        entry['_html_codec'] = 'zstd'
+    return entry
+
+
+def _decompress(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a stored entry with its HTML decompressed."""
+    result = copy_result(entry)
+    if result.pop('_html_codec', None) == 'zstd':
+        result['html'] = zstandard.ZstdDecompressor().decompress(result['html']).decode('utf-8')
+    return result
+
+
+class ScrapeCache:
+    """
+    LRU cache of scrape results with a time-to-live per entry.
+
+    Entries expire ttl_seconds after they are stored; once max_entries is
+    reached the least recently used entry is evicted. HTML is kept
+    zstd-compressed and only decompressed on a hit. Safe to share between
+    threads, e.g. the background event loop and the caller's own.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry (default: settings.cache_ttl_seconds)
+            max_entries: Maximum number of entries (default: settings.cache_max_entries)
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.cache_ttl_seconds
+        self.max_entries = max_entries if max_entries is not None else settings.cache_max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached result, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+        return _decompress(result)
+
+    def put(self, key: Hashable, result: Dict[str, Any]):
+        """
+        Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            result: Scrape result to cache
+        """
+        if self.max_entries <= 0:
+            return
+
+        entry = (time.monotonic() + self.ttl_seconds, _compress(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskScrapeCache:
+    """
+    On-disk cache of scrape results backed by diskcache.
+
+    Entries are stored with zstd-compressed HTML in a SQLite-indexed
+    directory, so they survive restarts and every worker process pointing
+    at the same directory shares them.
+    """
+
+    def __init__(self, directory: Optional[str] = None,
+                 ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: settings.cache_dir)
+            ttl_seconds: Lifetime of an entry (default: settings.cache_ttl_seconds)
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.cache_ttl_seconds
+        self._cache = diskcache.Cache(
+            directory or settings.cache_dir,
+            eviction_policy='least-recently-used'
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached result, or None if missing or expired
+        """
+        entry = self._cache.get(key)
+        return _decompress(entry) if entry is not None else None
+
+    def put(self, key: Hashable, result: Dict[str, Any]):
+        """
+        Store a result until its TTL runs out.
+
+        Args:
+            key: Cache key
+            result: Scrape result to cache
+        """
+        self._cache.set(key, _compress(result), expire=self.ttl_seconds)
+
+    def clear(self):
+        """Remove all entries."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def create_cache():
+    """
+    Create the scrape cache selected by settings.cache_backend.
+
+    Returns:
+        A DiskScrapeCache for "disk", a ScrapeCache for "memory", and a
+        ScrapeCache that never stores anything for "none"
+    """
+    if settings.cache_backend == 'disk':
+        return DiskScrapeCache()
+    if settings.cache_backend == 'none':
+        return ScrapeCache(max_entries=0)
+    return ScrapeCache()
+
+
+# Global cache instance
+cache = create_cache()
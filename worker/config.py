@@ -3,7 +3,7 @@ Configuration settings for the scraper worker.
 """
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -17,8 +17,29 @@ class Settings(BaseSettings):
     headless: bool = True
     timeout: int = 30000  # milliseconds
     max_concurrent_scrapes: int = 5
+    wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "domcontentloaded"
+    blocked_resource_types: List[str] = ["image", "font", "media", "stylesheet"]  # [] to load everything
+    
+    # Browser pool settings
+    browser_pool_size: int = 1  # shared browsers; each scrape gets its own context
+    browser_pool_recycle_after: int = 100  # scrapes served before a browser is relaunched
+    
+    # Cache settings
+    cache_backend: Literal["memory", "disk", "none"] = "memory"
+    cache_dir: str = ".scrape_cache"  # used by the disk backend
+    cache_ttl_seconds: int = 3600
+    cache_max_entries: int = 1000
     
     # Browser settings
+    max_host_contexts: int = 8  # per-host contexts a scraper keeps open
+    cdp_endpoint: Optional[str] = None  # e.g. http://chromium:9222; connect instead of launching
+    launch_args: List[str] = [
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-gpu",
+        "--no-zygote",
+        "--mute-audio",
+    ]
     viewport_width: int = 1920
     viewport_height: int = 1080
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -0,0 +1,181 @@
+"""
+Browser Pool Module
+
+Keeps pre-launched Chromium instances around so scrapes don't pay the
+browser cold start on every call. Browsers are shared: each scrape opens
+its own lightweight BrowserContext on a pooled browser instead of getting
+a whole Chromium process to itself.
+"""
+
+from playwright.async_api import async_playwright, Browser, Playwright
+from typing import Dict, List, Optional, Any
+import asyncio
+
+if __package__:
+    from .config import settings
+else:
+    from config import settings
+
+
+class BrowserPool:
+    """
+    Pool of pre-warmed, shared Chromium browsers.
+
+    Scrapers lease a browser for each scrape: acquire() picks the least busy
+    browser and release() hands the lease back; any number of leases can be
+    open on one browser at a time. Each browser counts the scrapes it has
+    served and is retired once it reaches the recycle threshold: a fresh
+    browser takes its slot right away and the old one is closed as soon as
+    its last lease is released.
+    """
+
+    def __init__(self, size: Optional[int] = None, headless: bool = True,
+                 recycle_after: Optional[int] = None):
+        """
+        Initialize the pool. Browsers are launched by warm().
+
+        Args:
+            size: Number of browsers to keep (default: settings.browser_pool_size)
+            headless: Whether to run browsers in headless mode
+            recycle_after: Scrapes before a browser is retired
+                (default: settings.browser_pool_recycle_after)
+        """
+        self.size = size or settings.browser_pool_size
+        self.headless = headless
+        self.recycle_after = recycle_after or settings.browser_pool_recycle_after
+        self.playwright: Optional[Playwright] = None
+        self._browsers: List[Browser] = []
+        self._retiring: List[Browser] = []
+        self._open: Dict[Browser, int] = {}
+        self._served: Dict[Browser, int] = {}
+        self._lock = asyncio.Lock()
+        self._recycled = 0
+
+    async def warm(self):
+        """Start Playwright and launch all browsers in the pool."""
+        async with self._lock:
+            await self._warm()
+
+    async def _warm(self):
+        """Launch missing browsers. Caller must hold the lock."""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        while len(self._browsers) < self.size:
+            self._browsers.append(await self._launch())
+
+    async def _launch(self) -> Browser:
+        """
+        Launch a new browser and register it with the pool.
+
+        When settings.cdp_endpoint is set, connect to that already running
+        browser over CDP instead of starting a local Chromium.
+        """
+        if settings.cdp_endpoint:
+            browser = await self.playwright.chromium.connect_over_cdp(settings.cdp_endpoint)
+        else:
+            browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=settings.launch_args
+            )
+        self._open[browser] = 0
+        self._served[browser] = 0
+        return browser
+
+    async def acquire(self, prefer: Optional[Browser] = None) -> Browser:
+        """
+        Lease a browser for one scrape.
+
+        Args:
+            prefer: Browser to use if it is still in the pool, e.g. the one
+                holding the caller's context for a host; otherwise the least
+                busy browser is leased
+
+        Returns:
+            A shared Browser; pass it to release() when done with it
+        """
+        async with self._lock:
+            # Drop browsers that crashed or were closed underneath us
+            for browser in [b for b in self._browsers if not b.is_connected()]:
+                self._browsers.remove(browser)
+                self._retire(browser)
+            await self._warm()
+
+            if prefer in self._browsers:
+                browser = prefer
+            else:
+                browser = min(self._browsers, key=lambda b: self._open[b])
+            if self._served[browser] >= self.recycle_after:
+                self._browsers.remove(browser)
+                self._retire(browser)
+                browser = await self._launch()
+                self._browsers.append(browser)
+                self._recycled += 1
+
+            self._open[browser] += 1
+            self._served[browser] += 1
+
+        # Close retired browsers that had no leases left
+        await self._close_drained()
+        return browser
+
+    async def release(self, browser: Browser):
+        """
+        Return a lease on a browser to the pool.
+
+        Args:
+            browser: Browser previously returned by acquire()
+        """
+        if browser in self._open:
+            self._open[browser] -= 1
+        await self._close_drained()
+
+    def _retire(self, browser: Browser):
+        """Stop handing out a browser; it is closed once it drains."""
+        self._retiring.append(browser)
+
+    async def _close_drained(self):
+        """Close retired browsers that have no open leases."""
+        drained = [b for b in self._retiring if self._open.get(b, 0) <= 0]
+        self._retiring = [b for b in self._retiring if b not in drained]
+        for browser in drained:
+            self._open.pop(browser, None)
+            self._served.pop(browser, None)
+            try:
+                await browser.close()
+            except Exception:
+                pass  # Already closed
+
+    async def close(self):
+        """Close every browser and stop Playwright."""
+        async with self._lock:
+            for browser in self._browsers + self._retiring:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass  # Already closed
+            self._browsers.clear()
+            self._retiring.clear()
+            self._open.clear()
+            self._served.clear()
+
+            try:
+                if self.playwright:
+                    await self.playwright.stop()
+            except Exception:
+                pass  # Already stopped
+            self.playwright = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report pool usage for metrics.
+
+        Returns:
+            Dictionary with browser counts, open leases and recycle events
+        """
+        return {
+            'size': self.size,
+            'browsers': len(self._browsers),
+            'retiring': len(self._retiring),
+            'open_leases': sum(self._open.values()),
+            'recycled': self._recycled,
+        }
@@ -5,19 +5,207 @@ This module provides a scalable web scraping solution using Playwright.
 It can be triggered multiple times and is designed for concurrent usage.
 """
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page, Route, Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
 from typing import Dict, Optional, Any
-from datetime import datetime
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 import asyncio
+import time
 from urllib.parse import urlparse
 
+if __package__:
+    from .pool import BrowserPool
+    from .cache import cache, copy_result, normalize_url
+    from .config import settings
+    from ._loop import get_loop
+else:
+    from pool import BrowserPool
+    from cache import cache, copy_result, normalize_url
+    from config import settings
+    from _loop import get_loop
+
+
+# Running totals across all scrapes in this process: counts plus the summed
+# per-phase timings from ScrapeResult.timings. Read it through stats().
+STATS: Counter = Counter()
+
+# Shared pools, one per event loop and headless mode; Playwright objects are
+# bound to the loop that created them. Created by get_pool() and removed by
+# shutdown_shared_browser(), so nothing outlives an explicit shutdown.
+_pools: Dict[asyncio.AbstractEventLoop, Dict[bool, BrowserPool]] = {}
+
+# Chromium network errors worth retrying a navigation for; anything else
+# (invalid URL, closed page or context, ...) will not go away by waiting.
+_TRANSIENT_NET_ERRORS = (
+    'net::ERR_CONNECTION_RESET',
+    'net::ERR_CONNECTION_CLOSED',
+    'net::ERR_CONNECTION_REFUSED',
+    'net::ERR_CONNECTION_TIMED_OUT',
+    'net::ERR_TIMED_OUT',
+    'net::ERR_NETWORK_CHANGED',
+    'net::ERR_INTERNET_DISCONNECTED',
+    'net::ERR_EMPTY_RESPONSE',
+    'net::ERR_ADDRESS_UNREACHABLE',
+    'net::ERR_HTTP2_PROTOCOL_ERROR',
+)
+
+
+def get_pool(headless: bool = True) -> BrowserPool:
+    """
+    Get the shared browser pool for the running event loop, creating it.
+    
+    Scrapers on this loop use the shared pool instead of launching their
+    own browser. Await shutdown_shared_browser() before the loop exits, or
+    use the shared_browser() context manager which does it for you.
+    
+    Args:
+        headless: Whether the pool's browsers run in headless mode
+    
+    Returns:
+        The BrowserPool shared by all scrapers on this loop
+    """
+    pools = _pools.setdefault(asyncio.get_running_loop(), {})
+    if headless not in pools:
+        pools[headless] = BrowserPool(headless=headless)
+    return pools[headless]
+
+
+def _find_pool(headless: bool) -> Optional[BrowserPool]:
+    """Return the running loop's shared pool, if one was created."""
+    return _pools.get(asyncio.get_running_loop(), {}).get(headless)
+
+
+async def shutdown_shared_browser():
+    """
+    Close the shared browsers owned by the running event loop.
+    
+    Call this before the event loop exits; scrapers only close their own
+    contexts and leave the shared browsers running.
+    """
+    pools = _pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.close()
+
+
+@asynccontextmanager
+async def shared_browser(headless: bool = True):
+    """
+    Keep a warm shared browser for every scrape inside the block.
+    
+    Args:
+        headless: Whether the shared browser runs in headless mode
+    
+    Example:
+        async with shared_browser():
+            for url in urls:
+                result = await scrape_url(url)
+    """
+    pool = get_pool(headless)
+    try:
+        await pool.warm()
+        yield pool
+    finally:
+        await shutdown_shared_browser()
+
+
+def stats() -> Dict[str, Any]:
+    """
+    Report scrape, cache and browser pool metrics for this process.
+    
+    Returns:
+        Dictionary with aggregated scrape counters and phase timings
+        ('scrapes'), the number of cached results ('cache_entries') and
+        the stats() of every browser pool ('pools')
+    """
+    return {
+        'scrapes': dict(STATS),
+        'cache_entries': len(cache),
+        'pools': [pool.stats() for pools in list(_pools.values())
+                  for pool in pools.values()],
+    }
+
+
+@dataclass(slots=True)
+class ScrapeResult:
+    """
+    Result of a single scrape.
+    
+    Attributes:
+        url: The final URL (after any redirects)
+        html: The page HTML content
+        title: Page title
+        meta: Dictionary of metadata (description, keywords, etc.)
+        status_code: HTTP status code
+        timestamp_ns: When the scrape was performed, in nanoseconds since
+            the epoch (see format_timestamp)
+        success: Boolean indicating if scrape was successful
+        error: Error message if scrape failed
+        cached: Whether the result was served from the scrape cache
+        timings: Nanoseconds spent in each phase of the scrape (page_ns,
+            goto_ns, selector_ns, content_ns, meta_ns) and in total (total_ns)
+    """
+    url: str
+    html: Optional[str] = None
+    title: Optional[str] = None
+    meta: Dict[str, Any] = field(default_factory=dict)
+    status_code: Optional[int] = None
+    timestamp_ns: int = 0
+    success: bool = False
+    error: Optional[str] = None
+    cached: bool = False
+    timings: Dict[str, int] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary returned by the module-level functions."""
+        return {
+            'url': self.url,
+            'html': self.html,
+            'title': self.title,
+            'meta': self.meta,
+            'status_code': self.status_code,
+            'timestamp_ns': self.timestamp_ns,
+            'success': self.success,
+            'error': self.error,
+            'cached': self.cached,
+            'timings': self.timings
+        }
+
+
+def format_timestamp(timestamp_ns: int) -> str:
+    """
+    Format a result's timestamp_ns as an ISO 8601 UTC string.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch, as stored in results
+    
+    Returns:
+        ISO 8601 timestamp, e.g. '2024-01-15T10:30:00.123456+00:00'
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+async def _block_resources(route: Route):
+    """Abort requests for resource types the scraper doesn't need."""
+    if route.request.resource_type in settings.blocked_resource_types:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class WebScraper:
     """
     Scalable web scraper using Playwright.
     
-    This class manages browser instances and provides a simple interface
-    to scrape webpages and extract HTML content, URL, and metadata.
+    This class scrapes on browsers from a BrowserPool and provides a simple
+    interface to scrape webpages and extract HTML content, URL, and metadata.
+    Every scrape leases a browser for its duration, which lets the pool
+    recycle browsers by scrape count. Scrapes of the same host share one
+    BrowserContext, so repeated pages of a site reuse its warm connections,
+    DNS and TLS sessions.
     """
     
     def __init__(self, headless: bool = True, timeout: int = 30000):
@@ -30,29 +218,40 @@ class WebScraper:
         """
         self.headless = headless
         self.timeout = timeout
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
+        self.pool: Optional[BrowserPool] = None
+        self._owns_pool = False
+        self._contexts: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        # Scrapes currently using each context; only unused ones are evicted
+        self._in_use: Counter = Counter()
+        # Replaced contexts still in use; closed once their last scrape ends
+        self._retired: set = set()
     
     async def __aenter__(self):
-        """Context manager entry - initialize browser."""
+        """Context manager entry - start the browser pool."""
         await self._initialize_browser()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - cleanup browser."""
+        """Context manager exit - cleanup contexts and browser."""
         await self.close()
         return False
     
     async def _initialize_browser(self):
-        """Initialize the Playwright browser instance."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        )
+        """Use the shared browser pool, or launch a private one if there is none."""
+        if self.pool:
+            return
+        self.pool = _find_pool(self.headless)
+        if self.pool is None:
+            # No shared browser on this loop; use one that closes with us
+            self.pool = BrowserPool(headless=self.headless)
+            self._owns_pool = True
+        try:
+            await self.pool.warm()
+        except Exception:
+            await self.close()
+            raise
     
-    async def scrape(self, url: str, wait_for_selector: Optional[str] = None) -> Dict[str, Any]:
+    async def scrape(self, url: str, wait_for_selector: Optional[str] = None) -> ScrapeResult:
         """
         Scrape a single webpage and return HTML content, URL, and metadata.
         
@@ -67,59 +266,68 @@ class WebScraper:
             wait_for_selector: Optional CSS selector to wait for before scraping
         
         Returns:
-            Dictionary containing:
-                - url: The final URL (after any redirects)
-                - html: The page HTML content
-                - title: Page title
-                - meta: Dictionary of metadata (description, keywords, etc.)
-                - status_code: HTTP status code
-                - timestamp: When the scrape was performed
-                - success: Boolean indicating if scrape was successful
-                - error: Error message if scrape failed
+            ScrapeResult with the final URL, HTML, title, metadata, status
+            code and timestamp, or success=False and the error message.
+            Use ScrapeResult.to_dict() for the dictionary form.
         """
-        if not self.browser or not self.context:
+        if not self.pool:
             await self._initialize_browser()
         
+        host = urlparse(url).netloc.lower()
+        browser: Optional[Browser] = None
+        context: Optional[BrowserContext] = None
         page: Optional[Page] = None
-        result = {
-            'url': url,
-            'html': None,
-            'title': None,
-            'meta': {},
-            'status_code': None,
-            'timestamp': datetime.utcnow().isoformat(),
-            'success': False,
-            'error': None
-        }
+        result = ScrapeResult(url=url, timestamp_ns=time.time_ns())
+        timings = result.timings
+        started = mark = time.perf_counter_ns()
+        
+        def lap(phase: str):
+            # Record time since the previous phase ended
+            nonlocal mark
+            now = time.perf_counter_ns()
+            timings[phase] = now - mark
+            mark = now
         
         try:
-            # Create new page
-            page = await self.context.new_page()
+            # Lease a browser for this scrape, preferring the one that
+            # already holds this host's context
+            current = self._contexts.get(host)
+            browser = await self.pool.acquire(prefer=current.browser if current else None)
+            
+            # Open a page in this host's context on that browser
+            context = await self._get_context(host, browser)
+            page = await context.new_page()
             page.set_default_timeout(self.timeout)
+            lap('page_ns')
             
-            # Navigate to URL
-            response = await page.goto(url, wait_until='networkidle')
+            # Navigate to URL, retrying transient failures on the same page
+            response = await self._goto_with_retry(page, url)
+            lap('goto_ns')
             
             if response:
-                result['status_code'] = response.status
-                result['url'] = page.url  # Get final URL after redirects
+                result.status_code = response.status
+                result.url = page.url  # Get final URL after redirects
             
             # Wait for specific selector if provided
             if wait_for_selector:
                 await page.wait_for_selector(wait_for_selector)
+                lap('selector_ns')
             
-            # Extract page content
-            result['html'] = await page.content()
-            result['title'] = await page.title()
+            # Extract page content; both reads are independent round-trips
+            result.html, result.title = await asyncio.gather(
+                page.content(), page.title()
+            )
+            lap('content_ns')
             
-            # Extract metadata
-            result['meta'] = await self._extract_metadata(page)
+            # Extract metadata from the HTML we already have
+            result.meta = self._extract_metadata_from_html(result.html)
+            lap('meta_ns')
             
-            result['success'] = True
+            result.success = True
             
         except Exception as e:
-            result['error'] = str(e)
-            result['success'] = False
+            result.error = str(e)
+            result.success = False
         
         finally:
             if page:
@@ -127,15 +335,128 @@ class WebScraper:
                     await page.close()
                 except Exception:
                     pass  # Page already closed
+            if context:
+                self._in_use[context] -= 1
+                if self._in_use[context] <= 0:
+                    del self._in_use[context]
+                    if context in self._retired:
+                        self._retired.discard(context)
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass  # Context already closed
+            if browser:
+                await self.pool.release(browser)
+        
+        timings['total_ns'] = time.perf_counter_ns() - started
+        STATS['scrapes'] += 1
+        if not result.success:
+            STATS['failures'] += 1
+        STATS.update(timings)
         
         return result
     
-    async def _extract_metadata(self, page: Page) -> Dict[str, Any]:
+    async def _get_context(self, host: str, browser: Browser) -> BrowserContext:
         """
-        Extract metadata from the page.
+        Get the browser context for a host, creating it if needed.
+        
+        A context left on another browser (e.g. one the pool recycled) is
+        replaced; if a scrape is still using it, it is closed when that
+        scrape finishes. At most settings.max_host_contexts contexts are kept;
+        beyond that the least recently used ones no scrape is using are
+        closed. The returned context is marked in use; the caller must
+        decrement self._in_use when done with it.
+        
+        Args:
+            host: Host (netloc) of the URL being scraped
+            browser: Browser leased for this scrape
+        
+        Returns:
+            BrowserContext shared by all scrapes of this host on that browser
+        """
+        context = self._contexts.get(host)
+        if context and context.browser is browser:
+            self._contexts.move_to_end(host)
+            self._in_use[context] += 1
+            return context
+        
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        )
+        if settings.blocked_resource_types:
+            await context.route('**/*', _block_resources)
+        
+        # Another scrape of this host may have created one while we awaited
+        existing = self._contexts.get(host)
+        if existing and existing.browser is browser:
+            self._in_use[existing] += 1
+            await context.close()
+            self._contexts.move_to_end(host)
+            return existing
+        
+        self._contexts[host] = context
+        self._contexts.move_to_end(host)
+        self._in_use[context] += 1
+        if existing and self._in_use[existing]:
+            # Replaced context from another browser; its last scrape closes it
+            self._retired.add(existing)
+        elif existing:
+            # Replaced context from another browser; nothing is using it
+            try:
+                await existing.close()
+            except Exception:
+                pass  # Context already closed
+        
+        # Close least recently used idle contexts beyond the limit
+        overflow = len(self._contexts) - settings.max_host_contexts
+        idle = [h for h, c in self._contexts.items() if not self._in_use[c]]
+        evicted = [self._contexts.pop(h) for h in idle[:max(overflow, 0)]]
+        for stale in evicted:
+            try:
+                await stale.close()
+            except Exception:
+                pass  # Context already closed
+        
+        return context
+    
+    async def _goto_with_retry(self, page: Page, url: str):
+        """
+        Navigate to a URL, retrying with exponential backoff.
+        
+        Timeouts and transient network errors (see _TRANSIENT_NET_ERRORS)
+        are retried up to settings.max_retries times, waiting
+        settings.retry_delay * 2**attempt seconds between attempts; the last
+        error is raised once retries run out. Any other error is raised
+        right away.
         
         Args:
             page: Playwright Page object
+            url: The URL to navigate to
+        
+        Returns:
+            The navigation Response, or None
+        """
+        for attempt in range(settings.max_retries + 1):
+            try:
+                return await page.goto(url, wait_until=settings.wait_until)
+            except PlaywrightError as e:
+                transient = isinstance(e, PlaywrightTimeoutError) or any(
+                    code in str(e) for code in _TRANSIENT_NET_ERRORS)
+                if not transient or attempt == settings.max_retries:
+                    raise
+                await asyncio.sleep(settings.retry_delay * 2 ** attempt)
+    
+    @staticmethod
+    def _extract_metadata_from_html(html: str) -> Dict[str, Any]:
+        """
+        Extract metadata from already fetched page HTML.
+        
+        Parsing happens locally with selectolax, so no browser round-trips
+        are needed.
+        
+        Args:
+            html: The page HTML content
         
         Returns:
             Dictionary containing meta tags and other metadata
@@ -143,28 +464,25 @@ class WebScraper:
         metadata = {}
         
         try:
-            # Extract common meta tags
-            meta_tags = await page.query_selector_all('meta')
+            tree = LexborHTMLParser(html)
             
-            for meta in meta_tags:
-                name = await meta.get_attribute('name')
-                property_attr = await meta.get_attribute('property')
-                content = await meta.get_attribute('content')
-                
-                if name and content:
-                    metadata[name] = content
-                elif property_attr and content:
-                    metadata[property_attr] = content
+            # Extract common meta tags
+            for meta in tree.css('meta'):
+                attrs = meta.attributes
+                key = attrs.get('name') or attrs.get('property')
+                content = attrs.get('content')
+                if key and content:
+                    metadata[key] = content
             
             # Extract canonical URL if exists
-            canonical = await page.query_selector('link[rel="canonical"]')
+            canonical = tree.css_first('link[rel="canonical"]')
             if canonical:
-                metadata['canonical'] = await canonical.get_attribute('href')
+                metadata['canonical'] = canonical.attributes.get('href')
             
             # Extract language
-            html_element = await page.query_selector('html')
+            html_element = tree.css_first('html')
             if html_element:
-                lang = await html_element.get_attribute('lang')
+                lang = html_element.attributes.get('lang')
                 if lang:
                     metadata['language'] = lang
         
@@ -174,39 +492,54 @@ class WebScraper:
         return metadata
     
     async def close(self):
-        """Close the browser and cleanup resources."""
-        try:
-            if self.context:
-                await self.context.close()
-        except Exception:
-            pass  # Already closed
-        
-        try:
-            if self.browser:
-                await self.browser.close()
-        except Exception:
-            pass  # Already closed
+        """Close this scraper's contexts, and its browser pool if it is private."""
+        contexts = list(self._contexts.values()) + list(self._retired)
+        self._contexts.clear()
+        self._retired.clear()
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass  # Context already closed
         
-        try:
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
-        except Exception:
-            pass  # Already stopped
+        if self._owns_pool:
+            await self.pool.close()
+            self.pool = None
+            self._owns_pool = False
+
+
+async def _on_background_loop(coro):
+    """
+    Await a coroutine on the background event loop.
+    
+    The background loop's shared browser pool lives for the whole process,
+    so every caller, on any loop or thread, reuses the same warm browsers.
+    """
+    loop = get_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
 
 
 # Simple function interface for single scrapes
 async def scrape_url(url: str, headless: bool = True, 
-                     wait_for_selector: Optional[str] = None) -> Dict[str, Any]:
+                     wait_for_selector: Optional[str] = None,
+                     force_rescrape: bool = False) -> Dict[str, Any]:
     """
     Simple function to scrape a URL. This is the main entry point.
     
     Use this function when you need to scrape a single URL without
-    managing the browser lifecycle yourself.
+    managing the browser lifecycle yourself. Scrapes run on a shared
+    background event loop, so its browser pool stays warm between calls.
+    Successful results are cached for settings.cache_ttl_seconds; a cache
+    hit is returned with cached=True and the timestamp of the original
+    scrape.
     
     Args:
         url: The URL to scrape
         headless: Whether to run browser in headless mode
         wait_for_selector: Optional CSS selector to wait for
+        force_rescrape: Skip the cache lookup and scrape the page again
     
     Returns:
         Dictionary containing scraped data and metadata
@@ -218,21 +551,26 @@ async def scrape_url(url: str, headless: bool = True,
             print(result['title'])
             print(result['meta'])
     """
-    async with WebScraper(headless=headless) as scraper:
-        return await scraper.scrape(url, wait_for_selector)
+    return await _on_background_loop(
+        _scrape_url_shared(url, headless, wait_for_selector, force_rescrape)
+    )
 
 
 def scrape_url_sync(url: str, headless: bool = True, 
-                    wait_for_selector: Optional[str] = None) -> Dict[str, Any]:
+                    wait_for_selector: Optional[str] = None,
+                    force_rescrape: bool = False) -> Dict[str, Any]:
     """
     Synchronous wrapper for scrape_url.
     
     Use this when you need to call the scraper from synchronous code.
+    Scrapes run on a shared background event loop, so its browser pool
+    stays warm between calls.
     
     Args:
         url: The URL to scrape
         headless: Whether to run browser in headless mode
         wait_for_selector: Optional CSS selector to wait for
+        force_rescrape: Skip the cache lookup and scrape the page again
     
     Returns:
         Dictionary containing scraped data and metadata
@@ -242,22 +580,40 @@ def scrape_url_sync(url: str, headless: bool = True,
         if result['success']:
             print(result['html'])
     """
+    loop = get_loop()
     try:
-        # Check if we're already in an event loop
-        loop = asyncio.get_running_loop()
-        # If we are, we can't use asyncio.run(), so we need a different approach
-        import concurrent.futures
-        import threading
-        
-        def run_in_thread():
-            return asyncio.run(scrape_url(url, headless, wait_for_selector))
-        
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
-            return future.result()
+        running = asyncio.get_running_loop()
     except RuntimeError:
-        # No event loop running, safe to use asyncio.run()
-        return asyncio.run(scrape_url(url, headless, wait_for_selector))
+        running = None
+    if running is loop:
+        raise RuntimeError('scrape_url_sync() cannot be called from the scraper event loop; '
+                           'await scrape_url() instead')
+    
+    future = asyncio.run_coroutine_threadsafe(
+        _scrape_url_shared(url, headless, wait_for_selector, force_rescrape), loop
+    )
+    return future.result()
+
+
+async def _scrape_url_shared(url: str, headless: bool = True,
+                             wait_for_selector: Optional[str] = None,
+                             force_rescrape: bool = False) -> Dict[str, Any]:
+    """Scrape a URL using the background loop's long-lived shared browser."""
+    key = (normalize_url(url), wait_for_selector)
+    if not force_rescrape:
+        hit = cache.get(key)
+        if hit is not None:
+            STATS['cache_hits'] += 1
+            return dict(hit, cached=True)
+        STATS['cache_misses'] += 1
+    
+    get_pool(headless)
+    async with WebScraper(headless=headless) as scraper:
+        result = (await scraper.scrape(url, wait_for_selector)).to_dict()
+    
+    if result['success']:
+        cache.put(key, result)
+    return result
 
 
 # For batch scraping multiple URLs efficiently
@@ -266,8 +622,11 @@ async def scrape_urls_batch(urls: list[str], headless: bool = True,
     """
     Scrape multiple URLs concurrently with controlled concurrency.
     
-    This function reuses the same browser instance for efficiency
-    and limits concurrent scraping to avoid overwhelming resources.
+    Scrapes run on the shared background event loop, reusing its warm
+    browser pool, with a fixed number of workers that pull URLs from a
+    queue, so only max_concurrent scrapes are in flight at any time. URLs
+    that normalize to the same address are scraped once and the result is
+    copied to each of their positions.
     
     Args:
         urls: List of URLs to scrape
@@ -275,7 +634,10 @@ async def scrape_urls_batch(urls: list[str], headless: bool = True,
         max_concurrent: Maximum number of concurrent scrapes
     
     Returns:
-        List of dictionaries containing scraped data
+        List of dictionaries containing scraped data, one per input URL
+    
+    Raises:
+        ValueError: If max_concurrent is less than 1
     
     Example:
         urls = ['https://example.com', 'https://example.org']
@@ -283,12 +645,39 @@ async def scrape_urls_batch(urls: list[str], headless: bool = True,
         for result in results:
             print(f"{result['url']}: {result['success']}")
     """
+    if max_concurrent < 1:
+        raise ValueError(f'max_concurrent must be at least 1, got {max_concurrent}')
+    return await _on_background_loop(_scrape_urls_batch_shared(urls, headless, max_concurrent))
+
+
+async def _scrape_urls_batch_shared(urls: list[str], headless: bool,
+                                    max_concurrent: int) -> list[Dict[str, Any]]:
+    """Scrape a batch using the background loop's long-lived shared browser."""
+    # Scrape each normalized URL once, using its first spelling in the batch
+    keys = [normalize_url(url) for url in urls]
+    unique: Dict[str, str] = {}
+    for key, url in zip(keys, urls):
+        unique.setdefault(key, url)
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(unique.values()):
+        queue.put_nowait(item)
+    results: list[Optional[Dict[str, Any]]] = [None] * len(unique)
+    
+    get_pool(headless)
     async with WebScraper(headless=headless) as scraper:
-        semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def scrape_with_limit(url: str):
-            async with semaphore:
-                return await scraper.scrape(url)
+        async def worker():
+            # Pull URLs until the queue is drained
+            while True:
+                try:
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[index] = (await scraper.scrape(url)).to_dict()
         
-        tasks = [scrape_with_limit(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(unique)))))
+    
+    # Fan results back out to every input position
+    positions = {key: index for index, key in enumerate(unique)}
+    return [copy_result(results[positions[key]]) for key in keys]
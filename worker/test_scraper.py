@@ -5,8 +5,8 @@ Run this to verify the scraper works correctly.
 """
 
 import asyncio
-import json
-from scraper import scrape_url, scrape_url_sync, scrape_urls_batch
+import orjson
+from scraper import scrape_url, scrape_url_sync, scrape_urls_batch, format_timestamp, stats
 
 
 async def test_single_scrape():
@@ -20,7 +20,7 @@ async def test_single_scrape():
     print(f"Success: {result['success']}")
     print(f"Status Code: {result['status_code']}")
     print(f"Title: {result['title']}")
-    print(f"Timestamp: {result['timestamp']}")
+    print(f"Timestamp: {format_timestamp(result['timestamp_ns'])}")
     print(f"HTML Length: {len(result['html']) if result['html'] else 0} characters")
     print(f"Metadata Keys: {list(result['meta'].keys())}")
     
@@ -90,8 +90,8 @@ def save_result_to_file(result, filename="scrape_result.json"):
     if result_copy.get('html'):
         result_copy['html'] = f"<HTML content - {len(result_copy['html'])} characters>"
     
-    with open(filename, 'w') as f:
-        json.dump(result_copy, f, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(result_copy, option=orjson.OPT_INDENT_2))
     
     print(f"\nResult saved to {filename}")
 
@@ -116,6 +116,9 @@ async def main():
         if result1['success']:
             save_result_to_file(result1)
         
+        # Show where the time went
+        print(f"\nStats: {stats()}")
+        
         print("\n" + "=" * 60)
         print("All tests completed!")
         print("=" * 60)